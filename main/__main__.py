@@ -10,7 +10,10 @@ import os
 import sys
 import asyncio
 
-from .server_factory import create_mcp_server
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +26,10 @@ logger = logging.getLogger(__name__)
 async def main_async():
     """Async main entry point for the MCP server."""
     try:
+        # Deferred so the FastMCP, Starlette and httpx imports happen after startup begins
+        from .controllers.vcenter_controller import close_shared_services
+        from .server_factory import create_mcp_server
+        
         # Get port from Cloud Foundry environment (required for health checks)
         port = int(os.getenv('PORT', 8080))
         host = os.getenv('HOST', '0.0.0.0')
@@ -31,11 +38,16 @@ async def main_async():
         logger.info(f"MCP server initialized, starting with HTTP transport on {host}:{port}...")
         
         # Configure HTTP transport for Spring AI WebMVC compatibility
-        await app.run_http_async(
-            transport="http", 
-            host=host,
-            port=port
-        )
+        try:
+            await app.run_http_async(
+                transport="http", 
+                host=host,
+                port=port
+            )
+        finally:
+            # Pooled vCenter clients are shared across sessions, close them once on exit
+            await close_shared_services()
+            logger.info("vCenter HTTP clients closed")
         
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
@@ -47,7 +59,11 @@ async def main_async():
 def main():
     """Main entry point for the MCP server."""
     try:
-        asyncio.run(main_async())
+        # Prefer the libuv-based event loop when it is installed
+        if uvloop is not None:
+            uvloop.run(main_async())
+        else:
+            asyncio.run(main_async())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
         sys.exit(0)
@@ -6,8 +6,10 @@ and Cloud Foundry service binding integration.
 """
 
 import os
+import re
 import json
 import logging
+from functools import lru_cache
 from typing import Tuple, Optional
 from dotenv import load_dotenv
 
@@ -15,13 +17,29 @@ from ..models.vcenter_config import VCenterConfig, VCenterCredentials
 
 logger = logging.getLogger(__name__)
 
+# The .env file does not change after startup, so it only needs loading once
+_DOTENV_LOADED = False
+
+# Service names or labels containing any of these keywords are treated as vCenter
+_VCENTER_SERVICE_RE = re.compile(r"vcenter|vmware|esxi", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _parse_vcap_services(vcap_services: str) -> dict:
+    """Parse VCAP_SERVICES, reusing the result while the value is unchanged."""
+    return json.loads(vcap_services)
+
 
 class ConfigManager:
     """Manages configuration and credentials for the vCenter MCP Server."""
     
     def __init__(self):
         """Initialize the configuration manager."""
-        load_dotenv()
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
+        self._config: Optional[VCenterConfig] = None
     
     def get_vcenter_credentials(self) -> VCenterCredentials:
         """
@@ -54,9 +72,15 @@ class ConfigManager:
         """
         Get complete vCenter configuration.
         
+        The configuration is built once per ConfigManager and reused on
+        subsequent calls.
+        
         Returns:
             VCenterConfig object with all connection parameters
         """
+        if self._config is not None:
+            return self._config
+        
         credentials = self.get_vcenter_credentials()
         
         # Get optional configuration with proper error handling
@@ -70,13 +94,14 @@ class ConfigManager:
             logger.warning(f"Invalid VCENTER_TIMEOUT value '{timeout_str}', using default 30")
             timeout = 30
         
-        return VCenterConfig(
+        self._config = VCenterConfig(
             host=credentials.host,
             username=credentials.username,
             password=credentials.password,
             verify_ssl=verify_ssl,
             timeout=timeout
         )
+        return self._config
     
     def _get_credentials_from_service_binding(self) -> Optional[VCenterCredentials]:
         """Extract credentials from Cloud Foundry service binding."""
@@ -85,7 +110,7 @@ class ConfigManager:
             return None
         
         try:
-            services = json.loads(vcap_services)
+            services = _parse_vcap_services(vcap_services)
             
             # Look for vCenter service in the binding
             for service_type, service_list in services.items():
@@ -121,9 +146,5 @@ class ConfigManager:
     
     def _is_vcenter_service(self, service: dict) -> bool:
         """Check if a service is a vCenter service."""
-        service_name = service.get('name', '').lower()
-        service_label = service.get('label', '').lower()
-        
-        vcenter_keywords = ['vcenter', 'vmware', 'esxi']
-        return any(keyword in service_name or keyword in service_label 
-                  for keyword in vcenter_keywords) 
\ No newline at end of file
+        return bool(_VCENTER_SERVICE_RE.search(service.get('name', ''))
+                    or _VCENTER_SERVICE_RE.search(service.get('label', ''))) 
\ No newline at end of file
@@ -5,15 +5,59 @@ This module contains the controller layer that handles business logic
 and coordinates between the models and views.
 """
 
+import asyncio
 import logging
-from typing import List, Optional
+from dataclasses import astuple
+from typing import Dict, List, Optional, Tuple
 from fastmcp import FastMCP
 
 from ..models.vcenter_config import VCenterConfig, Cluster, ResourcePool, VirtualMachine
 from ..services.vcenter_service import VCenterService
+from ..utils.cache import TTLCache, async_ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# Seconds to keep name-to-ID lookups before re-fetching them from vCenter
+NAME_CACHE_TTL = 60
+
+# Seconds to keep cluster, resource pool and VM listings between tool calls
+LIST_CACHE_TTL = 30
+
+# Services shared by every controller using the same connection settings, so
+# pooled connections survive however often the server factory is invoked
+_SERVICE_CACHE: Dict[Tuple, VCenterService] = {}
+
+
+def _get_shared_service(config: VCenterConfig) -> VCenterService:
+    """
+    Get the shared VCenterService for a configuration, creating it if needed.
+    
+    Args:
+        config: vCenter configuration
+        
+    Returns:
+        VCenterService instance
+    """
+    key = astuple(config)
+    service = _SERVICE_CACHE.get(key)
+    if service is None:
+        service = VCenterService(config)
+        _SERVICE_CACHE[key] = service
+    return service
+
+
+async def close_shared_services():
+    """
+    Close every shared VCenterService and empty the service cache.
+    
+    Services outlive individual controllers and MCP sessions, so this is
+    called once when the process shuts down.
+    """
+    services = list(_SERVICE_CACHE.values())
+    _SERVICE_CACHE.clear()
+    for service in services:
+        await service.close()
+
 
 class VCenterController:
     """Controller for vCenter operations."""
@@ -26,9 +70,68 @@ class VCenterController:
             config: vCenter configuration
         """
         self.config = config
-        self.service = VCenterService(config)
+        self.service = _get_shared_service(config)
+        self._name_map_cache = TTLCache(ttl=NAME_CACHE_TTL, maxsize=4)
     
-    def get_clusters(self) -> List[Cluster]:
+    async def _get_name_map(self, kind: str) -> Dict[str, str]:
+        """
+        Get a cached name-to-ID map for clusters or resource pools.
+        
+        Args:
+            kind: Either 'cluster' or 'resource_pool'
+            
+        Returns:
+            Dictionary mapping object names to IDs
+        """
+        name_map = self._name_map_cache.get(kind)
+        if name_map is not None:
+            return name_map
+        
+        if kind == 'cluster':
+            # Reuse the cached cluster listing rather than fetching clusters again
+            named_ids = [(cluster.name, cluster.cluster_id) for cluster in await self.get_clusters()]
+        else:
+            named_ids = [
+                (raw_pool.get('name'), raw_pool.get('resource_pool', 'Unknown'))
+                for raw_pool in await self.service.get_resource_pools()
+            ]
+        
+        name_map = {}
+        for name, object_id in named_ids:
+            # Keep the first match, as the uncached lookups do
+            name_map.setdefault(name, object_id)
+        
+        # Don't cache an empty map, it usually means the lookup failed
+        if name_map:
+            self._name_map_cache.set(kind, name_map)
+        return name_map
+    
+    async def _get_cluster_id(self, cluster_name: str) -> Optional[str]:
+        """
+        Resolve a cluster name to its ID using the name cache.
+        
+        Args:
+            cluster_name: Name of the cluster
+            
+        Returns:
+            Cluster ID if found, None otherwise
+        """
+        return (await self._get_name_map('cluster')).get(cluster_name)
+    
+    async def _get_rp_id(self, resource_pool_name: str) -> Optional[str]:
+        """
+        Resolve a resource pool name to its ID using the name cache.
+        
+        Args:
+            resource_pool_name: Name of the resource pool
+            
+        Returns:
+            Resource pool ID if found, None otherwise
+        """
+        return (await self._get_name_map('resource_pool')).get(resource_pool_name)
+    
+    @async_ttl_cache(ttl=LIST_CACHE_TTL)
+    async def get_clusters(self) -> List[Cluster]:
         """
         Get all clusters from vCenter.
         
@@ -36,23 +139,22 @@ class VCenterController:
             List of Cluster objects
         """
         try:
-            raw_clusters = self.service.get_clusters()
-            clusters = []
-            
-            for raw_cluster in raw_clusters:
-                cluster = Cluster(
+            raw_clusters = await self.service.get_clusters()
+            clusters = [
+                Cluster(
                     cluster_id=raw_cluster.get('cluster', 'Unknown'),
                     name=raw_cluster.get('name', 'Unknown')
                 )
-                clusters.append(cluster)
+                for raw_cluster in raw_clusters
+            ]
             
-            logger.info(f"Retrieved {len(clusters)} clusters")
+            logger.info("Retrieved %d clusters", len(clusters))
             return clusters
         except Exception as e:
-            logger.error(f"Failed to get clusters: {e}")
+            logger.error("Failed to get clusters: %s", e)
             return []
     
-    def get_cluster_by_name(self, cluster_name: str) -> Optional[Cluster]:
+    async def get_cluster_by_name(self, cluster_name: str) -> Optional[Cluster]:
         """
         Get a specific cluster by name.
         
@@ -62,13 +164,14 @@ class VCenterController:
         Returns:
             Cluster object if found, None otherwise
         """
-        clusters = self.get_clusters()
+        clusters = await self.get_clusters()
         for cluster in clusters:
             if cluster.name == cluster_name:
                 return cluster
         return None
     
-    def get_resource_pools_in_cluster(self, cluster_name: str) -> List[ResourcePool]:
+    @async_ttl_cache(ttl=LIST_CACHE_TTL)
+    async def get_resource_pools_in_cluster(self, cluster_name: str) -> List[ResourcePool]:
         """
         Get all resource pools in a specific cluster.
         
@@ -79,29 +182,28 @@ class VCenterController:
             List of ResourcePool objects
         """
         try:
-            cluster = self.get_cluster_by_name(cluster_name)
-            if not cluster:
-                logger.warning(f"Cluster '{cluster_name}' not found")
+            cluster_id = await self._get_cluster_id(cluster_name)
+            if not cluster_id:
+                logger.warning("Cluster '%s' not found", cluster_name)
                 return []
             
-            raw_resource_pools = self.service.get_resource_pools(cluster_id=cluster.cluster_id)
-            resource_pools = []
-            
-            for raw_rp in raw_resource_pools:
-                resource_pool = ResourcePool(
+            raw_resource_pools = await self.service.get_resource_pools(cluster_id=cluster_id)
+            resource_pools = [
+                ResourcePool(
                     resource_pool_id=raw_rp.get('resource_pool', 'Unknown'),
                     name=raw_rp.get('name', 'Unknown'),
-                    cluster_id=cluster.cluster_id
+                    cluster_id=cluster_id
                 )
-                resource_pools.append(resource_pool)
+                for raw_rp in raw_resource_pools
+            ]
             
-            logger.info(f"Retrieved {len(resource_pools)} resource pools from cluster '{cluster_name}'")
+            logger.info("Retrieved %d resource pools from cluster '%s'", len(resource_pools), cluster_name)
             return resource_pools
         except Exception as e:
-            logger.error(f"Failed to get resource pools for cluster '{cluster_name}': {e}")
+            logger.error("Failed to get resource pools for cluster '%s': %s", cluster_name, e)
             return []
     
-    def get_resource_pool_by_name(self, resource_pool_name: str) -> Optional[ResourcePool]:
+    async def get_resource_pool_by_name(self, resource_pool_name: str) -> Optional[ResourcePool]:
         """
         Get a specific resource pool by name.
         
@@ -111,7 +213,7 @@ class VCenterController:
         Returns:
             ResourcePool object if found, None otherwise
         """
-        raw_resource_pools = self.service.get_resource_pools()
+        raw_resource_pools = await self.service.get_resource_pools()
         for raw_rp in raw_resource_pools:
             if raw_rp.get('name') == resource_pool_name:
                 return ResourcePool(
@@ -120,7 +222,8 @@ class VCenterController:
                 )
         return None
     
-    def get_vms_in_cluster(self, cluster_name: str) -> List[VirtualMachine]:
+    @async_ttl_cache(ttl=LIST_CACHE_TTL)
+    async def get_vms_in_cluster(self, cluster_name: str) -> List[VirtualMachine]:
         """
         Get all virtual machines in a specific cluster.
         
@@ -131,30 +234,30 @@ class VCenterController:
             List of VirtualMachine objects
         """
         try:
-            cluster = self.get_cluster_by_name(cluster_name)
-            if not cluster:
-                logger.warning(f"Cluster '{cluster_name}' not found")
+            cluster_id = await self._get_cluster_id(cluster_name)
+            if not cluster_id:
+                logger.warning("Cluster '%s' not found", cluster_name)
                 return []
             
-            raw_vms = self.service.get_virtual_machines(cluster_id=cluster.cluster_id)
-            vms = []
-            
-            for raw_vm in raw_vms:
-                vm = VirtualMachine(
+            raw_vms = await self.service.get_virtual_machines(cluster_id=cluster_id)
+            vms = [
+                VirtualMachine(
                     vm_id=raw_vm.get('vm', 'Unknown'),
                     name=raw_vm.get('name', 'Unknown'),
                     power_state=raw_vm.get('power_state', 'Unknown'),
-                    cluster_id=cluster.cluster_id
+                    cluster_id=cluster_id
                 )
-                vms.append(vm)
+                for raw_vm in raw_vms
+            ]
             
-            logger.info(f"Retrieved {len(vms)} VMs from cluster '{cluster_name}'")
+            logger.info("Retrieved %d VMs from cluster '%s'", len(vms), cluster_name)
             return vms
         except Exception as e:
-            logger.error(f"Failed to get VMs for cluster '{cluster_name}': {e}")
+            logger.error("Failed to get VMs for cluster '%s': %s", cluster_name, e)
             return []
     
-    def get_vms_in_resource_pool(self, resource_pool_name: str) -> List[VirtualMachine]:
+    @async_ttl_cache(ttl=LIST_CACHE_TTL)
+    async def get_vms_in_resource_pool(self, resource_pool_name: str) -> List[VirtualMachine]:
         """
         Get all virtual machines in a specific resource pool.
         
@@ -165,30 +268,29 @@ class VCenterController:
             List of VirtualMachine objects
         """
         try:
-            resource_pool = self.get_resource_pool_by_name(resource_pool_name)
-            if not resource_pool:
-                logger.warning(f"Resource pool '{resource_pool_name}' not found")
+            resource_pool_id = await self._get_rp_id(resource_pool_name)
+            if not resource_pool_id:
+                logger.warning("Resource pool '%s' not found", resource_pool_name)
                 return []
             
-            raw_vms = self.service.get_virtual_machines(resource_pool_id=resource_pool.resource_pool_id)
-            vms = []
-            
-            for raw_vm in raw_vms:
-                vm = VirtualMachine(
+            raw_vms = await self.service.get_virtual_machines(resource_pool_id=resource_pool_id)
+            vms = [
+                VirtualMachine(
                     vm_id=raw_vm.get('vm', 'Unknown'),
                     name=raw_vm.get('name', 'Unknown'),
                     power_state=raw_vm.get('power_state', 'Unknown'),
-                    resource_pool_id=resource_pool.resource_pool_id
+                    resource_pool_id=resource_pool_id
                 )
-                vms.append(vm)
+                for raw_vm in raw_vms
+            ]
             
-            logger.info(f"Retrieved {len(vms)} VMs from resource pool '{resource_pool_name}'")
+            logger.info("Retrieved %d VMs from resource pool '%s'", len(vms), resource_pool_name)
             return vms
         except Exception as e:
-            logger.error(f"Failed to get VMs for resource pool '{resource_pool_name}': {e}")
+            logger.error("Failed to get VMs for resource pool '%s': %s", resource_pool_name, e)
             return []
     
-    def get_vcenter_status(self) -> dict:
+    async def get_vcenter_status(self) -> dict:
         """
         Get vCenter connection status and basic information.
         
@@ -196,28 +298,38 @@ class VCenterController:
             Dictionary with status information
         """
         try:
-            # Test connection
-            if not self.service.test_connection():
+            # The three listings are independent, so fetch them concurrently; the
+            # cluster fetch raises when vCenter is unreachable and doubles as
+            # the connection check
+            results = await asyncio.gather(
+                self.service.fetch_clusters(),
+                self.service.fetch_resource_pools(),
+                self.service.fetch_virtual_machines(),
+                return_exceptions=True
+            )
+            raw_clusters, raw_resource_pools, raw_vms = results
+            
+            if isinstance(raw_clusters, Exception):
+                logger.error("vCenter connection check failed: %s", raw_clusters)
                 return {
                     'connection_status': 'Failed',
                     'host': self.config.host,
                     'error': 'Cannot connect to vCenter'
                 }
             
-            # Get basic stats
-            clusters = self.get_clusters()
-            raw_resource_pools = self.service.get_resource_pools()
-            raw_vms = self.service.get_virtual_machines()
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
             
             return {
                 'host': self.config.host,
-                'clusters_count': len(clusters),
+                'clusters_count': len(raw_clusters),
                 'resource_pools_count': len(raw_resource_pools),
                 'vms_count': len(raw_vms),
                 'connection_status': 'Connected'
             }
         except Exception as e:
-            logger.error(f"Error getting vCenter status: {e}")
+            logger.error("Error getting vCenter status: %s", e)
             return {
                 'connection_status': 'Error',
                 'host': self.config.host,
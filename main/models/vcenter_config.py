@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class VCenterConfig:
     """Configuration model for vCenter connection."""
     host: str
@@ -18,7 +18,7 @@ class VCenterConfig:
     timeout: int = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class VCenterCredentials:
     """Credentials model for vCenter authentication."""
     host: str
@@ -26,7 +26,7 @@ class VCenterCredentials:
     password: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Cluster:
     """Model representing a vCenter cluster."""
     cluster_id: str
@@ -34,7 +34,7 @@ class Cluster:
     resource_pools: Optional[list] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool:
     """Model representing a vCenter resource pool."""
     resource_pool_id: str
@@ -42,7 +42,7 @@ class ResourcePool:
     cluster_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualMachine:
     """Model representing a vCenter virtual machine."""
     vm_id: str
@@ -4,74 +4,104 @@ Server Factory.
 This module creates and configures the MCP server with proper MVC initialization.
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 from fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
+
+try:
+    from orjson import dumps as json_dumps
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json
+    
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 from .config.config_manager import ConfigManager
 from .controllers.vcenter_controller import VCenterController
+from .models.vcenter_config import VCenterConfig
 from .views.mcp_tools import MCPToolsView
 
 logger = logging.getLogger(__name__)
 
+# Health check responses are constant, so serialize them once and share them
+# across requests; Starlette responses are not mutated when sent
+_HEALTH_BODY = {"status": "healthy", "service": "vcenter-mcp", "version": "1.0.0"}
+_WARMING_BODY = {"status": "warming", "service": "vcenter-mcp", "version": "1.0.0"}
+_HEALTH_HEADERS = {"Cache-Control": "no-cache"}
+_HEALTH_RESPONSE = Response(
+    json_dumps(_HEALTH_BODY), media_type="application/json", headers=_HEALTH_HEADERS
+)
+_WARMING_RESPONSE = Response(
+    json_dumps(_WARMING_BODY), media_type="application/json", headers=_HEALTH_HEADERS
+)
+
 
-def create_mcp_server() -> FastMCP:
+async def _run_preflight(controller: VCenterController) -> bool:
     """
-    Create and configure the MCP server with proper MVC initialization.
+    Check vCenter connectivity so the first tool call doesn't pay the warm-up cost.
     
+    Args:
+        controller: VCenterController to check
+        
     Returns:
-        Configured FastMCP server instance
+        True if vCenter is reachable, False otherwise
     """
-    try:
-        # Initialize configuration
-        config_manager = ConfigManager()
-        config = config_manager.get_vcenter_config()
-        logger.info(f"Configuration loaded for vCenter at {config.host}")
-        
-        # Initialize controller
-        controller = VCenterController(config)
-        logger.info("vCenter controller initialized")
-        
-        # Initialize view with controller
-        view = MCPToolsView(controller)
-        logger.info("MCP tools view initialized")
-        
-        # Create and configure FastMCP application
-        app = FastMCP("vcenter-mcp")
-        
-        # Add health check endpoint
-        @app.custom_route("/health", methods=["GET"])
-        async def health_check(request: Request) -> JSONResponse:
-            """Health check endpoint for Cloud Foundry."""
-            return JSONResponse({
-                "status": "healthy",
-                "service": "vcenter-mcp",
-                "version": "1.0.0"
-            })
-        
-        # Register MCP tools
-        view.register_tools(app)
-        logger.info("MCP tools and health check endpoint registered")
-        
-        return app
-        
-    except Exception as e:
-        logger.error(f"Failed to create MCP server: {e}")
-        raise
+    connected = await controller.service.test_connection()
+    if connected:
+        logger.info("vCenter preflight connection check succeeded")
+    else:
+        logger.warning("vCenter preflight connection check failed")
+    return connected
 
 
-def create_mcp_server_with_config(config) -> FastMCP:
+def _create_lifespan(controller: VCenterController, startup_state: Dict[str, Any]):
     """
-    Create MCP server with a specific configuration.
+    Create a server lifespan that runs the vCenter preflight check.
+    
+    On startup the preflight check is scheduled in the background so the
+    server can answer health checks immediately. The shared HTTP client is
+    closed at process shutdown rather than here.
     
     Args:
-        config: VCenterConfig instance
+        controller: VCenterController to check
+        startup_state: Dictionary the preflight task is stored in
         
+    Returns:
+        Lifespan callable for FastMCP
+    """
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+        preflight = asyncio.create_task(_run_preflight(controller))
+        startup_state['preflight'] = preflight
+        try:
+            yield
+        finally:
+            preflight.cancel()
+    
+    return lifespan
+
+
+def create_mcp_server(config: Optional[VCenterConfig] = None) -> FastMCP:
+    """
+    Create and configure the MCP server with proper MVC initialization.
+    
+    Args:
+        config: Optional VCenterConfig instance; loaded from the environment
+            or Cloud Foundry service binding when not given
+    
     Returns:
         Configured FastMCP server instance
     """
     try:
+        # Initialize configuration
+        if config is None:
+            config = ConfigManager().get_vcenter_config()
+        logger.info(f"Configuration loaded for vCenter at {config.host}")
+        
         # Initialize controller
         controller = VCenterController(config)
         logger.info("vCenter controller initialized")
@@ -81,17 +111,17 @@ def create_mcp_server_with_config(config) -> FastMCP:
         logger.info("MCP tools view initialized")
         
         # Create and configure FastMCP application
-        app = FastMCP("vcenter-mcp")
+        startup_state: Dict[str, Any] = {}
+        app = FastMCP("vcenter-mcp", lifespan=_create_lifespan(controller, startup_state))
         
         # Add health check endpoint
         @app.custom_route("/health", methods=["GET"])
-        async def health_check(request: Request) -> JSONResponse:
+        async def health_check(request: Request) -> Response:
             """Health check endpoint for Cloud Foundry."""
-            return JSONResponse({
-                "status": "healthy",
-                "service": "vcenter-mcp",
-                "version": "1.0.0"
-            })
+            preflight = startup_state.get('preflight')
+            if preflight is not None and preflight.done():
+                return _HEALTH_RESPONSE
+            return _WARMING_RESPONSE
         
         # Register MCP tools
         view.register_tools(app)
@@ -101,4 +131,4 @@ def create_mcp_server_with_config(config) -> FastMCP:
         
     except Exception as e:
         logger.error(f"Failed to create MCP server: {e}")
-        raise 
\ No newline at end of file
+        raise
\ No newline at end of file
@@ -5,17 +5,35 @@ This module contains the service layer that handles data access
 and external API interactions with vCenter.
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin
-import requests
-from requests.auth import HTTPBasicAuth
-from requests.exceptions import RequestException
+import httpx
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as json_loads
 
 from ..models.vcenter_config import VCenterConfig
+from ..utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared vCenter client
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+KEEPALIVE_EXPIRY = 60
+
+# Transient gateway errors are retried with exponential backoff
+MAX_RETRIES = 2
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+# Bounds on the ETag cache of parsed GET responses
+ETAG_CACHE_TTL = 300
+ETAG_CACHE_MAXSIZE = 64
+
 
 class VCenterService:
     """Service layer for vCenter REST API interactions."""
@@ -29,36 +47,48 @@ class VCenterService:
         """
         self.config = config
         self.host = config.host.rstrip('/')
-        self.session = self._create_session()
+        self._client = self._create_client()
         
-        # Disable SSL warnings if verify_ssl is False
-        if not config.verify_ssl:
-            self._disable_ssl_warnings()
+        # Resolved once so each request skips URL joining and attribute lookups
+        self._base_url = f"{self.host}/rest/"
+        self._request = self._client.request
+        
+        # Parsed GET responses keyed by URL, revalidated with If-None-Match
+        self._etag_cache = TTLCache(ttl=ETAG_CACHE_TTL, maxsize=ETAG_CACHE_MAXSIZE)
     
-    def _create_session(self) -> requests.Session:
-        """Create and configure requests session."""
-        session = requests.Session()
-        session.auth = HTTPBasicAuth(self.config.username, self.config.password)
-        session.verify = self.config.verify_ssl
-        session.timeout = self.config.timeout
-        
-        # Add default headers
-        session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-        })
-        
-        return session
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create and configure the pooled async HTTP client."""
+        # Keep TLS connections alive across calls and retry failed connects
+        transport = httpx.AsyncHTTPTransport(
+            verify=self.config.verify_ssl,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+            retries=MAX_RETRIES
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            auth=(self.config.username, self.config.password),
+            timeout=self.config.timeout,
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'application/json',
+            },
+        )
     
-    def _disable_ssl_warnings(self):
-        """Disable SSL warnings for self-signed certificates."""
-        try:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-        except ImportError:
-            logger.warning("urllib3 not available, SSL warnings may appear")
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying HTTP client has been closed."""
+        return self._client.is_closed
+    
+    async def close(self):
+        """Close the underlying HTTP client and release pooled connections."""
+        await self._client.aclose()
     
-    def _make_request(self, endpoint: str, method: str = "GET", **kwargs) -> Dict[str, Any]:
+    async def _make_request(self, endpoint: str, method: str = "GET", **kwargs) -> Dict[str, Any]:
         """
         Make a request to the vCenter REST API.
         
@@ -73,21 +103,55 @@ class VCenterService:
         Raises:
             Exception: If the request fails
         """
-        url = urljoin(f"{self.host}/rest/", endpoint)
+        url = self._base_url + endpoint.lstrip('/')
+        cached = self._etag_cache.get(url) if method == "GET" else None
+        if cached is not None:
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'If-None-Match': cached[0]}
         
         try:
-            logger.debug(f"Making {method} request to {url}")
-            response = self.session.request(method, url, **kwargs)
+            logger.debug("Making %s request to %s", method, url)
+            for attempt in range(MAX_RETRIES + 1):
+                response = await self._request(method, url, **kwargs)
+                if (method != "GET" or response.status_code not in RETRY_STATUS_CODES
+                        or attempt == MAX_RETRIES):
+                    break
+                logger.warning("vCenter returned %s, retrying request to %s", response.status_code, url)
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+            
+            if cached is not None and response.status_code == 304:
+                logger.debug("Using cached response for %s", url)
+                return cached[1]
+            
             response.raise_for_status()
-            return response.json()
-        except RequestException as e:
-            logger.error(f"API request failed: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response status: {e.response.status_code}")
-                logger.error(f"Response body: {e.response.text}")
+            data = json_loads(response.content)
+            
+            etag = response.headers.get('ETag')
+            if method == "GET" and etag:
+                self._etag_cache.set(url, (etag, data))
+            return data
+        except httpx.HTTPError as e:
+            logger.error("API request failed: %s", e)
+            if isinstance(e, httpx.HTTPStatusError):
+                logger.error("Response status: %s", e.response.status_code)
+                logger.error("Response body: %s", e.response.text)
             raise Exception(f"vCenter API request failed: {e}")
     
-    def get_clusters(self) -> List[Dict[str, Any]]:
+    async def fetch_clusters(self) -> List[Dict[str, Any]]:
+        """
+        Get all clusters from vCenter, raising if vCenter cannot be reached.
+        
+        Returns:
+            List of cluster objects
+            
+        Raises:
+            Exception: If the request fails
+        """
+        response = await self._make_request("vcenter/cluster")
+        clusters = response.get("value", [])
+        logger.info("Retrieved %d clusters from vCenter", len(clusters))
+        return clusters
+    
+    async def get_clusters(self) -> List[Dict[str, Any]]:
         """
         Get all clusters from vCenter.
         
@@ -95,15 +159,34 @@ class VCenterService:
             List of cluster objects
         """
         try:
-            response = self._make_request("vcenter/cluster")
-            clusters = response.get("value", [])
-            logger.info(f"Retrieved {len(clusters)} clusters from vCenter")
-            return clusters
+            return await self.fetch_clusters()
         except Exception as e:
-            logger.error(f"Failed to get clusters: {e}")
+            logger.error("Failed to get clusters: %s", e)
             return []
     
-    def get_resource_pools(self, cluster_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def fetch_resource_pools(self, cluster_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get resource pools, optionally filtered by cluster, raising on failure.
+        
+        Args:
+            cluster_id: Optional cluster ID to filter by
+            
+        Returns:
+            List of resource pool objects
+            
+        Raises:
+            Exception: If the request fails
+        """
+        endpoint = "vcenter/resource-pool"
+        if cluster_id:
+            endpoint += f"?clusters={cluster_id}"
+        
+        response = await self._make_request(endpoint)
+        resource_pools = response.get("value", [])
+        logger.info("Retrieved %d resource pools from vCenter", len(resource_pools))
+        return resource_pools
+    
+    async def get_resource_pools(self, cluster_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get resource pools, optionally filtered by cluster.
         
@@ -114,20 +197,44 @@ class VCenterService:
             List of resource pool objects
         """
         try:
-            endpoint = "vcenter/resource-pool"
-            if cluster_id:
-                endpoint += f"?clusters={cluster_id}"
-            
-            response = self._make_request(endpoint)
-            resource_pools = response.get("value", [])
-            logger.info(f"Retrieved {len(resource_pools)} resource pools from vCenter")
-            return resource_pools
+            return await self.fetch_resource_pools(cluster_id)
         except Exception as e:
-            logger.error(f"Failed to get resource pools: {e}")
+            logger.error("Failed to get resource pools: %s", e)
             return []
     
-    def get_virtual_machines(self, cluster_id: Optional[str] = None, 
-                           resource_pool_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def fetch_virtual_machines(self, cluster_id: Optional[str] = None, 
+                                     resource_pool_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get virtual machines, optionally filtered by cluster or resource pool, raising on failure.
+        
+        Args:
+            cluster_id: Optional cluster ID to filter by
+            resource_pool_id: Optional resource pool ID to filter by
+            
+        Returns:
+            List of virtual machine objects
+            
+        Raises:
+            Exception: If the request fails
+        """
+        endpoint = "vcenter/vm"
+        params = []
+        
+        if cluster_id:
+            params.append(f"clusters={cluster_id}")
+        if resource_pool_id:
+            params.append(f"resource_pools={resource_pool_id}")
+        
+        if params:
+            endpoint += "?" + "&".join(params)
+        
+        response = await self._make_request(endpoint)
+        vms = response.get("value", [])
+        logger.info("Retrieved %d virtual machines from vCenter", len(vms))
+        return vms
+    
+    async def get_virtual_machines(self, cluster_id: Optional[str] = None, 
+                                   resource_pool_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get virtual machines, optionally filtered by cluster or resource pool.
         
@@ -139,26 +246,12 @@ class VCenterService:
             List of virtual machine objects
         """
         try:
-            endpoint = "vcenter/vm"
-            params = []
-            
-            if cluster_id:
-                params.append(f"clusters={cluster_id}")
-            if resource_pool_id:
-                params.append(f"resource_pools={resource_pool_id}")
-            
-            if params:
-                endpoint += "?" + "&".join(params)
-            
-            response = self._make_request(endpoint)
-            vms = response.get("value", [])
-            logger.info(f"Retrieved {len(vms)} virtual machines from vCenter")
-            return vms
+            return await self.fetch_virtual_machines(cluster_id, resource_pool_id)
         except Exception as e:
-            logger.error(f"Failed to get virtual machines: {e}")
+            logger.error("Failed to get virtual machines: %s", e)
             return []
     
-    def test_connection(self) -> bool:
+    async def test_connection(self) -> bool:
         """
         Test the connection to vCenter.
         
@@ -166,9 +259,9 @@ class VCenterService:
             True if connection is successful, False otherwise
         """
         try:
-            # Try to get clusters as a simple test
-            self.get_clusters()
+            # Request clusters directly, get_clusters() would swallow the error
+            await self._make_request("vcenter/cluster")
             return True
         except Exception as e:
-            logger.error(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False 
\ No newline at end of file
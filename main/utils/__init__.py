@@ -0,0 +1 @@
+# Utils package for vCenter MCP Server 
\ No newline at end of file
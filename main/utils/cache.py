@@ -0,0 +1,131 @@
+"""
+Caching Utilities.
+
+This module contains small in-process caches used to avoid repeated
+round-trips to vCenter for data that changes rarely.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """In-process cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Time-to-live for each entry in seconds
+            maxsize: Maximum number of entries; the oldest entry is evicted first
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+        
+        Returns:
+            Cached value, or default if not present
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            # Dicts preserve insertion order, so the first key is the oldest
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+    
+    def invalidate(self, key: Optional[Hashable] = None):
+        """
+        Remove a single entry, or all entries when no key is given.
+        
+        Args:
+            key: Optional cache key to remove
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+def async_ttl_cache(ttl: float, maxsize: int = 128) -> Callable:
+    """
+    Cache the results of an async method per instance and arguments.
+    
+    Concurrent calls that miss the cache for the same arguments await a
+    single in-flight call instead of each making their own, whether or not
+    its result ends up cached. Falsy results are not cached, so an empty
+    result from a failed lookup is retried on the next call.
+    
+    Args:
+        ttl: Time-to-live for each cached result in seconds
+        maxsize: Maximum number of cached results per instance
+        
+    Returns:
+        Decorator for async methods
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache_attr = f"_{func.__name__}_cache"
+        inflight_attr = f"_{func.__name__}_inflight"
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = self.__dict__.get(cache_attr)
+            if cache is None:
+                cache = self.__dict__[cache_attr] = TTLCache(ttl=ttl, maxsize=maxsize)
+                self.__dict__[inflight_attr] = {}
+            inflight: Dict[Hashable, asyncio.Task] = self.__dict__[inflight_attr]
+            
+            key = (args, tuple(sorted(kwargs.items())))
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(self, *args, **kwargs))
+                inflight[key] = task
+                
+                def finish(done: asyncio.Task):
+                    # Runs before any waiter resumes, so no caller sees a gap
+                    # between the call finishing and its result being cached
+                    inflight.pop(key, None)
+                    if not done.cancelled() and done.exception() is None and done.result():
+                        cache.set(key, done.result())
+                
+                task.add_done_callback(finish)
+            
+            # Shielded so one cancelled caller doesn't cancel the shared call
+            return await asyncio.shield(task)
+        
+        return wrapper
+    
+    return decorator
@@ -16,10 +16,54 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Constant parts of the tool output, built once rather than on every call
+_NO_CLUSTERS = "No clusters found in vCenter"
+_CLUSTER_HEADER = "Clusters in vCenter:\n"
+_CLUSTER_LINE = "- {name} (ID: {cluster_id})\n".format
+_VM_LINE = "- {name} (Power: {power_state})\n".format
+_RESOURCE_POOL_LINE = "- {name} (ID: {resource_pool_id})\n".format
+_STATUS = (
+    "vCenter Status:\n"
+    "- Connected to: {host}\n"
+    "- Clusters: {clusters}\n"
+    "- Resource Pools: {resource_pools}\n"
+    "- Virtual Machines: {vms}\n"
+    "- Connection: {connection}\n"
+).format
+
 
 class MCPToolsView:
     """View layer for MCP tools that presents vCenter data."""
     
+    # Tool name, handler method name and description for each MCP tool
+    _TOOL_SPECS = (
+        (
+            "list_clusters",
+            "_list_clusters",
+            "List all clusters in vCenter. Returns a formatted list of all available clusters with their names and IDs."
+        ),
+        (
+            "list_vms_in_cluster",
+            "_list_vms_in_cluster",
+            "List all virtual machines in a specific cluster. Requires the cluster name as input and returns a formatted list of VMs with their names and power states."
+        ),
+        (
+            "list_resource_pools",
+            "_list_resource_pools",
+            "List all resource pools in a specific cluster. Requires the cluster name as input and returns a formatted list of resource pools with their names and IDs."
+        ),
+        (
+            "list_vms_in_resource_pool",
+            "_list_vms_in_resource_pool",
+            "List all virtual machines in a specific resource pool. Requires the resource pool name as input and returns a formatted list of VMs with their names and power states."
+        ),
+        (
+            "get_vcenter_status",
+            "_get_vcenter_status",
+            "Get vCenter connection status and basic information. Returns connection status, host information, and counts of clusters, resource pools, and virtual machines."
+        ),
+    )
+    
     def __init__(self, controller: 'VCenterController'):
         """
         Initialize the MCP tools view.
@@ -31,132 +75,81 @@ class MCPToolsView:
     
     def register_tools(self, app: FastMCP):
         """Register all MCP tools with the FastMCP application."""
-        
-        @app.tool(
-            name="list_clusters",
-            description="List all clusters in vCenter. Returns a formatted list of all available clusters with their names and IDs."
-        )
-        async def list_clusters() -> str:
-            """List all clusters in vCenter"""
-            try:
-                clusters = self.controller.get_clusters()
-                if not clusters:
-                    return "No clusters found in vCenter"
-                
-                result = "Clusters in vCenter:\n"
-                for cluster in clusters:
-                    result += f"- {cluster.name} (ID: {cluster.cluster_id})\n"
-                
-                return result
-            except Exception as e:
-                logger.error(f"Error listing clusters: {e}")
-                return f"Error listing clusters: {e}"
-        
-        @app.tool(
-            name="list_vms_in_cluster",
-            description="List all virtual machines in a specific cluster. Requires the cluster name as input and returns a formatted list of VMs with their names and power states."
-        )
-        async def list_vms_in_cluster(cluster_name: str) -> str:
-            """List all virtual machines in a specific cluster"""
-            try:
-                vms = self.controller.get_vms_in_cluster(cluster_name)
-                if not vms:
-                    return f"No virtual machines found in cluster '{cluster_name}'"
-                
-                result = f"Virtual machines in cluster '{cluster_name}':\n"
-                for vm in vms:
-                    result += f"- {vm.name} (Power: {vm.power_state})\n"
-                
-                return result
-            except Exception as e:
-                logger.error(f"Error listing VMs in cluster: {e}")
-                return f"Error listing VMs in cluster: {e}"
-        
-        @app.tool(
-            name="list_resource_pools",
-            description="List all resource pools in a specific cluster. Requires the cluster name as input and returns a formatted list of resource pools with their names and IDs."
-        )
-        async def list_resource_pools(cluster_name: str) -> str:
-            """List all resource pools in a specific cluster"""
-            try:
-                resource_pools = self.controller.get_resource_pools_in_cluster(cluster_name)
-                if not resource_pools:
-                    return f"No resource pools found in cluster '{cluster_name}'"
-                
-                result = f"Resource pools in cluster '{cluster_name}':\n"
-                for rp in resource_pools:
-                    result += f"- {rp.name} (ID: {rp.resource_pool_id})\n"
-                
-                return result
-            except Exception as e:
-                logger.error(f"Error listing resource pools: {e}")
-                return f"Error listing resource pools: {e}"
-        
-        @app.tool(
-            name="list_vms_in_resource_pool",
-            description="List all virtual machines in a specific resource pool. Requires the resource pool name as input and returns a formatted list of VMs with their names and power states."
-        )
-        async def list_vms_in_resource_pool(resource_pool_name: str) -> str:
-            """List all virtual machines in a specific resource pool"""
-            try:
-                vms = self.controller.get_vms_in_resource_pool(resource_pool_name)
-                if not vms:
-                    return f"No virtual machines found in resource pool '{resource_pool_name}'"
-                
-                result = f"Virtual machines in resource pool '{resource_pool_name}':\n"
-                for vm in vms:
-                    result += f"- {vm.name} (Power: {vm.power_state})\n"
-                
-                return result
-            except Exception as e:
-                logger.error(f"Error listing VMs in resource pool: {e}")
-                return f"Error listing VMs in resource pool: {e}"
-        
-        @app.tool(
-            name="get_vcenter_status",
-            description="Get vCenter connection status and basic information. Returns connection status, host information, and counts of clusters, resource pools, and virtual machines."
-        )
-        async def get_vcenter_status() -> str:
-            """Get vCenter connection status and basic information"""
-            try:
-                status_data = self.controller.get_vcenter_status()
-                return self.format_status(status_data)
-            except Exception as e:
-                logger.error(f"Error getting vCenter status: {e}")
-                return f"Error getting vCenter status: {e}"
+        for name, handler, description in self._TOOL_SPECS:
+            app.tool(name=name, description=description)(getattr(self, handler))
+    
+    async def _list_clusters(self) -> str:
+        """List all clusters in vCenter"""
+        try:
+            clusters = await self.controller.get_clusters()
+            return self.format_cluster_list(clusters)
+        except Exception as e:
+            logger.error("Error listing clusters: %s", e)
+            return f"Error listing clusters: {e}"
+    
+    async def _list_vms_in_cluster(self, cluster_name: str) -> str:
+        """List all virtual machines in a specific cluster"""
+        try:
+            vms = await self.controller.get_vms_in_cluster(cluster_name)
+            return self.format_vm_list(vms, f"cluster '{cluster_name}'")
+        except Exception as e:
+            logger.error("Error listing VMs in cluster: %s", e)
+            return f"Error listing VMs in cluster: {e}"
+    
+    async def _list_resource_pools(self, cluster_name: str) -> str:
+        """List all resource pools in a specific cluster"""
+        try:
+            resource_pools = await self.controller.get_resource_pools_in_cluster(cluster_name)
+            return self.format_resource_pool_list(resource_pools, f"cluster '{cluster_name}'")
+        except Exception as e:
+            logger.error("Error listing resource pools: %s", e)
+            return f"Error listing resource pools: {e}"
+    
+    async def _list_vms_in_resource_pool(self, resource_pool_name: str) -> str:
+        """List all virtual machines in a specific resource pool"""
+        try:
+            vms = await self.controller.get_vms_in_resource_pool(resource_pool_name)
+            return self.format_vm_list(vms, f"resource pool '{resource_pool_name}'")
+        except Exception as e:
+            logger.error("Error listing VMs in resource pool: %s", e)
+            return f"Error listing VMs in resource pool: {e}"
+    
+    async def _get_vcenter_status(self) -> str:
+        """Get vCenter connection status and basic information"""
+        try:
+            status_data = await self.controller.get_vcenter_status()
+            return self.format_status(status_data)
+        except Exception as e:
+            logger.error("Error getting vCenter status: %s", e)
+            return f"Error getting vCenter status: {e}"
     
     def format_cluster_list(self, clusters: list[Cluster]) -> str:
         """Format a list of clusters for display."""
         if not clusters:
-            return "No clusters found"
-        
-        result = "Clusters in vCenter:\n"
-        for cluster in clusters:
-            result += f"- {cluster.name} (ID: {cluster.cluster_id})\n"
+            return _NO_CLUSTERS
         
-        return result
+        return _CLUSTER_HEADER + "".join(
+            _CLUSTER_LINE(name=cluster.name, cluster_id=cluster.cluster_id) for cluster in clusters
+        )
     
     def format_vm_list(self, vms: list[VirtualMachine], context: str) -> str:
         """Format a list of virtual machines for display."""
         if not vms:
             return f"No virtual machines found in {context}"
         
-        result = f"Virtual machines in {context}:\n"
-        for vm in vms:
-            result += f"- {vm.name} (Power: {vm.power_state})\n"
-        
-        return result
+        return f"Virtual machines in {context}:\n" + "".join(
+            _VM_LINE(name=vm.name, power_state=vm.power_state) for vm in vms
+        )
     
     def format_resource_pool_list(self, resource_pools: list[ResourcePool], context: str) -> str:
         """Format a list of resource pools for display."""
         if not resource_pools:
             return f"No resource pools found in {context}"
         
-        result = f"Resource pools in {context}:\n"
-        for rp in resource_pools:
-            result += f"- {rp.name} (ID: {rp.resource_pool_id})\n"
-        
-        return result
+        return f"Resource pools in {context}:\n" + "".join(
+            _RESOURCE_POOL_LINE(name=rp.name, resource_pool_id=rp.resource_pool_id)
+            for rp in resource_pools
+        )
     
     def format_status(self, status_data: dict) -> str:
         """Format vCenter status information for display."""
@@ -166,11 +159,10 @@ class MCPToolsView:
         if status_data.get('connection_status') == 'Error':
             return f"Error getting vCenter status: {status_data.get('error', 'Unknown error')}"
         
-        result = "vCenter Status:\n"
-        result += f"- Connected to: {status_data.get('host', 'Unknown')}\n"
-        result += f"- Clusters: {status_data.get('clusters_count', 0)}\n"
-        result += f"- Resource Pools: {status_data.get('resource_pools_count', 0)}\n"
-        result += f"- Virtual Machines: {status_data.get('vms_count', 0)}\n"
-        result += f"- Connection: {status_data.get('connection_status', 'Unknown')}\n"
-        
-        return result 
\ No newline at end of file
+        return _STATUS(
+            host=status_data.get('host', 'Unknown'),
+            clusters=status_data.get('clusters_count', 0),
+            resource_pools=status_data.get('resource_pools_count', 0),
+            vms=status_data.get('vms_count', 0),
+            connection=status_data.get('connection_status', 'Unknown')
+        ) 
\ No newline at end of file
@@ -39,36 +39,40 @@ def setup_environment():
     # Prompt for configuration values
     print("Please provide your vCenter server details:")
     print()
+    updates = {}
     
     # Get vCenter host
     host = input("vCenter Host URL (e.g., https://vcenter.example.com): ").strip()
     if host:
-        update_env_value('VCENTER_HOST', host)
+        updates['VCENTER_HOST'] = host
     
     # Get username
     username = input("vCenter Username: ").strip()
     if username:
-        update_env_value('VCENTER_USERNAME', username)
+        updates['VCENTER_USERNAME'] = username
     
     # Get password
     password = input("vCenter Password: ").strip()
     if password:
-        update_env_value('VCENTER_PASSWORD', password)
+        updates['VCENTER_PASSWORD'] = password
     
     # Get SSL verification preference
     ssl_verify = input("Verify SSL certificates? (Y/n): ").lower().strip()
     if ssl_verify == 'n':
-        update_env_value('VCENTER_VERIFY_SSL', 'false')
+        updates['VCENTER_VERIFY_SSL'] = 'false'
     
     # Get timeout
     timeout = input("Request timeout in seconds (default: 30): ").strip()
     if timeout and timeout.isdigit():
-        update_env_value('VCENTER_TIMEOUT', timeout)
+        updates['VCENTER_TIMEOUT'] = timeout
     
     # Get log level
     log_level = input("Log level (DEBUG/INFO/WARNING/ERROR, default: INFO): ").strip().upper()
     if log_level in ['DEBUG', 'INFO', 'WARNING', 'ERROR']:
-        update_env_value('LOG_LEVEL', log_level)
+        updates['LOG_LEVEL'] = log_level
+    
+    # Write all values in a single pass over the .env file
+    apply_updates(updates)
     
     print()
     print("✅ Environment setup complete!")
@@ -81,31 +85,39 @@ def setup_environment():
     print("Note: Keep your .env file secure and never commit it to version control.")
 
 
-def update_env_value(key, value):
-    """Update a specific value in the .env file."""
-    if not os.path.exists('.env'):
+def apply_updates(updates):
+    """Update several values in the .env file with one read and one write."""
+    if not updates or not os.path.exists('.env'):
         return
     
+    pending = dict(updates)
+    
     # Read current .env file
     with open('.env', 'r') as f:
         lines = f.readlines()
     
-    # Update the specific key
-    updated = False
+    # Update every key found in the file
     for i, line in enumerate(lines):
-        if line.startswith(f'{key}='):
-            lines[i] = f'{key}={value}\n'
-            updated = True
-            break
+        key = line.split('=', 1)[0]
+        if '=' in line and key in pending:
+            lines[i] = f'{key}={pending.pop(key)}\n'
+            print(f"✅ Updated {key}")
+    
+    # Append keys that were not in the template
+    if pending and lines and not lines[-1].endswith('\n'):
+        lines[-1] += '\n'
+    for key, value in pending.items():
+        lines.append(f'{key}={value}\n')
+        print(f"✅ Added {key}")
     
     # Write back to .env file
     with open('.env', 'w') as f:
         f.writelines(lines)
-    
-    if updated:
-        print(f"✅ Updated {key}")
-    else:
-        print(f"⚠️  Could not find {key} in .env file")
+
+
+def update_env_value(key, value):
+    """Update a specific value in the .env file."""
+    apply_updates({key: value})
 
 
 def show_current_config():
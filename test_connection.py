@@ -5,6 +5,7 @@ Test script to verify vCenter connectivity and credentials.
 
 import os
 import sys
+import asyncio
 
 # Add main to path for development
 sys.path.insert(0, os.path.dirname(__file__))
@@ -12,9 +13,10 @@ sys.path.insert(0, os.path.dirname(__file__))
 from main.config.config_manager import ConfigManager
 from main.services.vcenter_service import VCenterService
 
-def test_connection():
+async def test_connection():
     """Test vCenter connection and basic API calls"""
     
+    service = None
     try:
         # Get configuration
         config_manager = ConfigManager()
@@ -33,21 +35,21 @@ def test_connection():
         print("\nTesting API calls...")
         
         # Test clusters
-        clusters = service.get_clusters()
+        clusters = await service.get_clusters()
         print(f"✓ Clusters API: Found {len(clusters)} clusters")
         for cluster in clusters[:3]:  # Show first 3
             print(f"  - {cluster.get('name', 'Unknown')}")
         
         # Test resource pools
-        resource_pools = service.get_resource_pools()
+        resource_pools = await service.get_resource_pools()
         print(f"✓ Resource Pools API: Found {len(resource_pools)} resource pools")
         
         # Test VMs
-        vms = service.get_virtual_machines()
+        vms = await service.get_virtual_machines()
         print(f"✓ Virtual Machines API: Found {len(vms)} VMs")
         
         # Test connection status
-        status = service.test_connection()
+        status = await service.test_connection()
         print(f"✓ Connection test: {'PASSED' if status else 'FAILED'}")
         
         print("\n🎉 All tests passed! vCenter connection is working correctly.")
@@ -56,7 +58,10 @@ def test_connection():
     except Exception as e:
         print(f"❌ Test failed: {e}")
         return False
+    finally:
+        if service is not None:
+            await service.close()
 
 if __name__ == "__main__":
-    success = test_connection()
+    success = asyncio.run(test_connection())
     sys.exit(0 if success else 1) 
\ No newline at end of file
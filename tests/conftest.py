@@ -0,0 +1,71 @@
+"""
+Shared pytest fixtures.
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+from unittest.mock import Mock, patch
+
+from main.models.vcenter_config import VCenterConfig
+from main.services.vcenter_service import VCenterService
+
+TEST_ENVIRONMENT = {
+    'VCENTER_HOST': 'https://test-vcenter.com',
+    'VCENTER_USERNAME': 'testuser',
+    'VCENTER_PASSWORD': 'testpass'
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_service_cache():
+    """Give each test an empty shared-service cache and discard what it adds."""
+    with patch.dict('main.controllers.vcenter_controller._SERVICE_CACHE', clear=True):
+        yield
+
+
+@pytest.fixture
+def vcenter_env():
+    """Set the standard test credentials in the environment for one test."""
+    with patch.dict('os.environ', TEST_ENVIRONMENT):
+        yield
+
+
+@pytest.fixture
+def fastmcp_mock():
+    """Fresh FastMCP application mock that rejects attributes FastMCP lacks."""
+    from fastmcp import FastMCP
+    
+    yield Mock(spec_set=FastMCP)
+
+
+@pytest.fixture(scope="module")
+def vcenter_config():
+    """vCenter configuration shared by the tests in a module; tests must not mutate it."""
+    yield VCenterConfig(
+        host="https://vcenter.example.com",
+        username="admin",
+        password="password123"
+    )
+
+
+@pytest_asyncio.fixture
+async def mock_transport_service(vcenter_config):
+    """
+    Factory for VCenterServices whose HTTP client sends requests to a handler.
+    
+    Only the transport is swapped, so requests keep the real client's auth,
+    headers and timeout. Every service built is closed when the test ends.
+    """
+    services = []
+    
+    def build(handler, config=None):
+        with patch('main.services.vcenter_service.httpx.AsyncHTTPTransport',
+                   side_effect=lambda **kwargs: httpx.MockTransport(handler)):
+            service = VCenterService(config or vcenter_config)
+        services.append(service)
+        return service
+    
+    yield build
+    for service in services:
+        await service.close()
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+Tests for the caching utilities.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from main.utils.cache import TTLCache, async_ttl_cache
+
+
+class TestTTLCache:
+    """Test the TTLCache class."""
+    
+    def test_get_and_set(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache(ttl=60)
+        cache.set('clusters', {'Test Cluster': 'cluster-123'})
+        
+        assert cache.get('clusters') == {'Test Cluster': 'cluster-123'}
+        assert cache.get('missing') is None
+        assert cache.get('missing', 'default') == 'default'
+    
+    @patch('main.utils.cache.time.monotonic')
+    def test_entries_expire(self, mock_monotonic):
+        """Test that entries are dropped once their TTL has passed."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(ttl=60)
+        cache.set('clusters', ['cluster-123'])
+        
+        mock_monotonic.return_value = 159.0
+        assert cache.get('clusters') == ['cluster-123']
+        
+        mock_monotonic.return_value = 160.0
+        assert cache.get('clusters') is None
+    
+    def test_maxsize_evicts_oldest(self):
+        """Test that the oldest entry is evicted when the cache is full."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+        
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+        assert cache.get('c') == 3
+    
+    def test_invalidate(self):
+        """Test invalidating a single entry and the whole cache."""
+        cache = TTLCache(ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        
+        cache.invalidate('a')
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+        
+        cache.invalidate()
+        assert cache.get('b') is None
+
+
+class _Lister:
+    """Stub with a cached async method that counts its calls."""
+    
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+    
+    @async_ttl_cache(ttl=60)
+    async def list_items(self, name):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.result
+
+
+class TestAsyncTTLCache:
+    """Test the async_ttl_cache decorator."""
+    
+    @pytest.mark.asyncio
+    async def test_results_are_cached_per_argument(self):
+        """Test that repeat calls with the same arguments reuse the result."""
+        lister = _Lister(['vm-1'])
+        
+        assert await lister.list_items('a') == ['vm-1']
+        assert await lister.list_items('a') == ['vm-1']
+        assert lister.calls == 1
+        
+        await lister.list_items('b')
+        assert lister.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self):
+        """Test that concurrent misses for the same key are coalesced."""
+        lister = _Lister(['vm-1'])
+        
+        results = await asyncio.gather(*(lister.list_items('a') for _ in range(5)))
+        
+        assert results == [['vm-1']] * 5
+        assert lister.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_empty_misses_share_one_call(self):
+        """Test that concurrent misses are coalesced even when the result isn't cached."""
+        lister = _Lister([])
+        
+        results = await asyncio.gather(*(lister.list_items('a') for _ in range(5)))
+        
+        assert results == [[]] * 5
+        assert lister.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_cached(self):
+        """Test that empty results are fetched again on the next call."""
+        lister = _Lister([])
+        
+        await lister.list_items('a')
+        await lister.list_items('a')
+        
+        assert lister.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_caches_are_per_instance(self):
+        """Test that instances don't share cached results."""
+        first = _Lister(['vm-1'])
+        second = _Lister(['vm-2'])
+        
+        assert await first.list_items('a') == ['vm-1']
+        assert await second.list_items('a') == ['vm-2']
+
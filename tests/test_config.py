@@ -73,6 +73,20 @@ class TestConfigManager:
         assert config.verify_ssl is False
         assert config.timeout == 60
     
+    @patch.dict(os.environ, {
+        'VCENTER_HOST': 'https://vcenter.example.com',
+        'VCENTER_USERNAME': 'admin',
+        'VCENTER_PASSWORD': 'password123'
+    }, clear=True)
+    def test_get_vcenter_config_is_cached(self):
+        """Test that the config is built once and reused."""
+        config_manager = ConfigManager()
+        config = config_manager.get_vcenter_config()
+        
+        with patch.dict(os.environ, {'VCENTER_TIMEOUT': '60'}):
+            assert config_manager.get_vcenter_config() is config
+            assert config_manager.get_vcenter_config().timeout == 30
+    
     @patch.dict(os.environ, {}, clear=True)
     def test_get_vcenter_config_missing_credentials(self):
         """Test getting vCenter config when credentials are missing."""
@@ -98,6 +98,35 @@ class TestConfigTemplate:
             assert hasattr(setup_env, 'show_current_config')
         except ImportError:
             pytest.skip("setup_env.py not available")
+    
+    def test_apply_updates_single_pass(self):
+        """Test that setup updates existing keys and appends missing ones."""
+        setup_env = pytest.importorskip("setup_env")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                with open('.env', 'w') as f:
+                    f.write("VCENTER_HOST=\n# comment\nLOG_LEVEL=INFO\n")
+                
+                setup_env.apply_updates({
+                    'LOG_LEVEL': 'DEBUG',
+                    'VCENTER_HOST': 'https://vcenter.example.com',
+                    'VCENTER_TIMEOUT': '60'
+                })
+                
+                with open('.env', 'r') as f:
+                    content = f.read()
+            finally:
+                os.chdir(cwd)
+        
+        assert content == (
+            "VCENTER_HOST=https://vcenter.example.com\n"
+            "# comment\n"
+            "LOG_LEVEL=DEBUG\n"
+            "VCENTER_TIMEOUT=60\n"
+        )
 
 
 class TestCloudFoundryServiceBinding:
@@ -127,6 +156,13 @@ class TestCloudFoundryServiceBinding:
             assert credentials.username == "admin"
             assert credentials.password == "password123"
     
+    def test_vcenter_service_detection_by_label(self):
+        """Test that services are matched on their label, case-insensitively."""
+        config_manager = ConfigManager()
+        
+        assert config_manager._is_vcenter_service({"name": "infra", "label": "VMware-vSphere"})
+        assert not config_manager._is_vcenter_service({"name": "my-mysql", "label": "p.mysql"})
+    
     def test_non_vcenter_service_ignored(self):
         """Test that non-vCenter services are ignored."""
         vcap_services = {
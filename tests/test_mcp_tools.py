@@ -0,0 +1,129 @@
+"""
+Tests for the MCP tools view layer.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from main.models.vcenter_config import Cluster, ResourcePool, VirtualMachine
+from main.views.mcp_tools import MCPToolsView
+
+
+class TestMCPToolsViewFormatting:
+    """Test the MCPToolsView formatting helpers."""
+    
+    def test_format_cluster_list(self):
+        """Test formatting a list of clusters."""
+        view = MCPToolsView(Mock())
+        clusters = [
+            Cluster(cluster_id="cluster-1", name="Cluster A"),
+            Cluster(cluster_id="cluster-2", name="Cluster B")
+        ]
+        
+        assert view.format_cluster_list(clusters) == (
+            "Clusters in vCenter:\n"
+            "- Cluster A (ID: cluster-1)\n"
+            "- Cluster B (ID: cluster-2)\n"
+        )
+        assert view.format_cluster_list([]) == "No clusters found in vCenter"
+    
+    def test_format_vm_list(self):
+        """Test formatting a list of virtual machines."""
+        view = MCPToolsView(Mock())
+        vms = [VirtualMachine(vm_id="vm-1", name="VM A", power_state="POWERED_ON")]
+        
+        assert view.format_vm_list(vms, "cluster 'Cluster A'") == (
+            "Virtual machines in cluster 'Cluster A':\n"
+            "- VM A (Power: POWERED_ON)\n"
+        )
+        assert view.format_vm_list([], "cluster 'Cluster A'") == (
+            "No virtual machines found in cluster 'Cluster A'"
+        )
+    
+    def test_format_resource_pool_list(self):
+        """Test formatting a list of resource pools."""
+        view = MCPToolsView(Mock())
+        resource_pools = [ResourcePool(resource_pool_id="rp-1", name="Pool A")]
+        
+        assert view.format_resource_pool_list(resource_pools, "cluster 'Cluster A'") == (
+            "Resource pools in cluster 'Cluster A':\n"
+            "- Pool A (ID: rp-1)\n"
+        )
+    
+    def test_format_status(self):
+        """Test formatting vCenter status information."""
+        view = MCPToolsView(Mock())
+        status_data = {
+            'host': 'https://vcenter.example.com',
+            'clusters_count': 2,
+            'resource_pools_count': 3,
+            'vms_count': 4,
+            'connection_status': 'Connected'
+        }
+        
+        assert view.format_status(status_data) == (
+            "vCenter Status:\n"
+            "- Connected to: https://vcenter.example.com\n"
+            "- Clusters: 2\n"
+            "- Resource Pools: 3\n"
+            "- Virtual Machines: 4\n"
+            "- Connection: Connected\n"
+        )
+        assert view.format_status({'connection_status': 'Failed', 'error': 'Cannot connect'}) == (
+            "Error: Cannot connect"
+        )
+
+
+class TestMCPToolsViewTools:
+    """Test the registered MCP tool handlers."""
+    
+    @staticmethod
+    def _register(controller):
+        """Register the tools on a stub app and return them by name."""
+        tools = {}
+        
+        def tool(name, description):
+            def decorator(fn):
+                tools[name] = fn
+                return fn
+            return decorator
+        
+        app = Mock()
+        app.tool.side_effect = tool
+        MCPToolsView(controller).register_tools(app)
+        return tools
+    
+    @pytest.mark.asyncio
+    async def test_list_vms_in_cluster(self):
+        """Test that the tool handler formats the controller result."""
+        controller = Mock()
+        controller.get_vms_in_cluster = AsyncMock(return_value=[
+            VirtualMachine(vm_id="vm-1", name="VM A", power_state="POWERED_ON")
+        ])
+        tools = self._register(controller)
+        
+        result = await tools["list_vms_in_cluster"]("Cluster A")
+        
+        assert result == "Virtual machines in cluster 'Cluster A':\n- VM A (Power: POWERED_ON)\n"
+        controller.get_vms_in_cluster.assert_awaited_once_with("Cluster A")
+    
+    @pytest.mark.asyncio
+    async def test_list_clusters_error(self):
+        """Test that controller errors are reported as text."""
+        controller = Mock()
+        controller.get_clusters = AsyncMock(side_effect=Exception("boom"))
+        tools = self._register(controller)
+        
+        assert await tools["list_clusters"]() == "Error listing clusters: boom"
+    
+    def test_all_tools_registered(self):
+        """Test that every tool is registered."""
+        tools = self._register(Mock())
+        
+        assert set(tools) == {
+            "list_clusters",
+            "list_vms_in_cluster",
+            "list_resource_pools",
+            "list_vms_in_resource_pool",
+            "get_vcenter_status"
+        }
@@ -2,88 +2,79 @@
 Tests for the MVC structure components.
 """
 
+import httpx
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from main.models.vcenter_config import VCenterConfig, Cluster, ResourcePool, VirtualMachine
 from main.config.config_manager import ConfigManager
 from main.services.vcenter_service import VCenterService
-from main.controllers.vcenter_controller import VCenterController
+from main.controllers.vcenter_controller import VCenterController, close_shared_services
+
+
+@pytest.fixture
+def service_mock():
+    """Fresh VCenterService mock that rejects attributes the service lacks."""
+    yield Mock(spec_set=VCenterService)
 
 
 class TestModels:
     """Test the data models."""
     
-    def test_vcenter_config_creation(self):
-        """Test creating a VCenterConfig instance."""
-        config = VCenterConfig(
-            host="https://vcenter.example.com",
-            username="admin",
-            password="password123",
-            verify_ssl=True,
-            timeout=30
-        )
-        
-        assert config.host == "https://vcenter.example.com"
-        assert config.username == "admin"
-        assert config.password == "password123"
-        assert config.verify_ssl is True
-        assert config.timeout == 30
-    
-    def test_cluster_creation(self):
-        """Test creating a Cluster instance."""
-        cluster = Cluster(
-            cluster_id="cluster-123",
-            name="Test Cluster"
-        )
-        
-        assert cluster.cluster_id == "cluster-123"
-        assert cluster.name == "Test Cluster"
-        assert cluster.resource_pools is None
-    
-    def test_resource_pool_creation(self):
-        """Test creating a ResourcePool instance."""
-        resource_pool = ResourcePool(
-            resource_pool_id="rp-123",
-            name="Test Resource Pool",
-            cluster_id="cluster-123"
-        )
-        
-        assert resource_pool.resource_pool_id == "rp-123"
-        assert resource_pool.name == "Test Resource Pool"
-        assert resource_pool.cluster_id == "cluster-123"
-    
-    def test_virtual_machine_creation(self):
-        """Test creating a VirtualMachine instance."""
-        vm = VirtualMachine(
-            vm_id="vm-123",
-            name="Test VM",
-            power_state="POWERED_ON",
-            cluster_id="cluster-123"
-        )
+    @pytest.mark.parametrize("cls,kwargs,expected", [
+        (
+            VCenterConfig,
+            {
+                'host': "https://vcenter.example.com",
+                'username': "admin",
+                'password': "password123",
+                'verify_ssl': True,
+                'timeout': 30
+            },
+            {
+                'host': "https://vcenter.example.com",
+                'username': "admin",
+                'password': "password123",
+                'verify_ssl': True,
+                'timeout': 30
+            }
+        ),
+        (
+            Cluster,
+            {'cluster_id': "cluster-123", 'name': "Test Cluster"},
+            {'cluster_id': "cluster-123", 'name': "Test Cluster", 'resource_pools': None}
+        ),
+        (
+            ResourcePool,
+            {'resource_pool_id': "rp-123", 'name': "Test Resource Pool", 'cluster_id': "cluster-123"},
+            {'resource_pool_id': "rp-123", 'name': "Test Resource Pool", 'cluster_id': "cluster-123"}
+        ),
+        (
+            VirtualMachine,
+            {'vm_id': "vm-123", 'name': "Test VM", 'power_state': "POWERED_ON", 'cluster_id': "cluster-123"},
+            {'vm_id': "vm-123", 'name': "Test VM", 'power_state': "POWERED_ON", 'cluster_id': "cluster-123"}
+        ),
+    ], ids=["vcenter_config", "cluster", "resource_pool", "virtual_machine"])
+    def test_model_creation(self, cls, kwargs, expected):
+        """Test creating each model and reading back its fields."""
+        obj = cls(**kwargs)
         
-        assert vm.vm_id == "vm-123"
-        assert vm.name == "Test VM"
-        assert vm.power_state == "POWERED_ON"
-        assert vm.cluster_id == "cluster-123"
+        for field, value in expected.items():
+            assert getattr(obj, field) == value
 
 
 class TestConfigManager:
     """Test the configuration manager."""
     
-    @patch.dict('os.environ', {
-        'VCENTER_HOST': 'https://vcenter.example.com',
-        'VCENTER_USERNAME': 'admin',
-        'VCENTER_PASSWORD': 'password123'
-    })
+    @pytest.mark.usefixtures('vcenter_env')
     def test_get_vcenter_config_from_env(self):
         """Test getting configuration from environment variables."""
         config_manager = ConfigManager()
         config = config_manager.get_vcenter_config()
         
-        assert config.host == "https://vcenter.example.com"
-        assert config.username == "admin"
-        assert config.password == "password123"
+        assert config.host == "https://test-vcenter.com"
+        assert config.username == "testuser"
+        assert config.password == "testpass"
         assert config.verify_ssl is True
         assert config.timeout == 30
 
@@ -91,87 +82,267 @@ class TestConfigManager:
 class TestVCenterService:
     """Test the vCenter service layer."""
     
-    def test_service_initialization(self):
+    def test_service_initialization(self, vcenter_config):
         """Test VCenterService initialization."""
+        service = VCenterService(vcenter_config)
+        assert service.config == vcenter_config
+        assert service.host == "https://vcenter.example.com"
+    
+    @pytest.mark.asyncio
+    async def test_make_request_builds_rest_url(self, mock_transport_service):
+        """Test that endpoints are joined onto the /rest/ base URL."""
+        seen_urls = []
+        
+        def handler(request):
+            seen_urls.append(str(request.url))
+            return httpx.Response(200, json={"value": []})
+        
         config = VCenterConfig(
-            host="https://vcenter.example.com",
+            host="https://vcenter.example.com/",
             username="admin",
             password="password123"
         )
+        service = mock_transport_service(handler, config)
         
-        service = VCenterService(config)
-        assert service.config == config
-        assert service.host == "https://vcenter.example.com"
+        await service._make_request("vcenter/cluster")
+        await service._make_request("/vcenter/vm?clusters=domain-c1")
+        
+        assert seen_urls == [
+            "https://vcenter.example.com/rest/vcenter/cluster",
+            "https://vcenter.example.com/rest/vcenter/vm?clusters=domain-c1"
+        ]
+    
+    @pytest.mark.asyncio
+    @patch('main.services.vcenter_service.asyncio.sleep', new_callable=AsyncMock)
+    async def test_make_request_retries_gateway_errors(self, mock_sleep, mock_transport_service):
+        """Test that transient gateway errors are retried before succeeding."""
+        statuses = [503, 502, 200]
+        
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={"value": []})
+        
+        service = mock_transport_service(handler)
+        
+        response = await service._make_request("vcenter/cluster")
+        
+        assert response == {"value": []}
+        assert not statuses
+        assert mock_sleep.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_test_connection_reports_failures(self, mock_transport_service):
+        """Test that the connection check fails when vCenter cannot be reached."""
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+        
+        service = mock_transport_service(handler)
+        
+        assert await service.test_connection() is False
+
+    @pytest.mark.asyncio
+    async def test_make_request_revalidates_with_etag(self, mock_transport_service):
+        """Test that repeat GETs send If-None-Match and reuse the cached body on 304."""
+        seen_etags = []
+        
+        def handler(request):
+            seen_etags.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"value": ["cluster-123"]}, headers={'ETag': '"v1"'})
+        
+        service = mock_transport_service(handler)
+        
+        first = await service._make_request("vcenter/cluster")
+        second = await service._make_request("vcenter/cluster")
+        
+        assert first == second == {"value": ["cluster-123"]}
+        assert seen_etags == [None, '"v1"']
 
 
 class TestVCenterController:
     """Test the vCenter controller."""
     
-    def test_controller_initialization(self):
+    def test_controller_initialization(self, vcenter_config):
         """Test VCenterController initialization."""
-        config = VCenterConfig(
-            host="https://vcenter.example.com",
-            username="admin",
-            password="password123"
-        )
-        
-        controller = VCenterController(config)
+        controller = VCenterController(vcenter_config)
         
-        assert controller.config == config
+        assert controller.config == vcenter_config
         assert controller.service is not None
         # Note: view is no longer created in controller to avoid circular imports
     
+    @pytest.mark.asyncio
+    async def test_controllers_share_service(self, vcenter_config):
+        """Test that controllers with the same config share one service until shutdown."""
+        first = VCenterController(vcenter_config)
+        second = VCenterController(vcenter_config)
+        shared = first.service
+        assert second.service is shared
+        assert not shared.is_closed
+        
+        await close_shared_services()
+        assert shared.is_closed
+        
+        third = VCenterController(vcenter_config)
+        assert third.service is not shared
+        await close_shared_services()
+    
+    @pytest.mark.asyncio
     @patch('main.controllers.vcenter_controller.VCenterService')
-    def test_get_clusters(self, mock_service_class):
+    async def test_get_clusters(self, mock_service_class, vcenter_config, service_mock):
         """Test getting clusters through the controller."""
         # Setup mock
-        mock_service = Mock()
-        mock_service.get_clusters.return_value = [
+        service_mock.get_clusters.return_value = [
             {'cluster': 'cluster-123', 'name': 'Test Cluster'}
         ]
-        mock_service_class.return_value = mock_service
+        mock_service_class.return_value = service_mock
         
         # Create controller
-        config = VCenterConfig(
-            host="https://vcenter.example.com",
-            username="admin",
-            password="password123"
-        )
-        controller = VCenterController(config)
+        controller = VCenterController(vcenter_config)
         
         # Test
-        clusters = controller.get_clusters()
+        clusters = await controller.get_clusters()
         
         assert len(clusters) == 1
         assert clusters[0].cluster_id == "cluster-123"
         assert clusters[0].name == "Test Cluster"
-        mock_service.get_clusters.assert_called_once()
+        service_mock.get_clusters.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    @patch('main.controllers.vcenter_controller.VCenterService')
+    async def test_cluster_name_lookup_is_cached(self, mock_service_class, vcenter_config, service_mock):
+        """Test that different listings for a cluster share the cached cluster name lookup."""
+        # Setup mock
+        service_mock.get_clusters.return_value = [
+            {'cluster': 'cluster-123', 'name': 'Test Cluster'}
+        ]
+        service_mock.get_virtual_machines.return_value = [
+            {'vm': 'vm-123', 'name': 'Test VM', 'power_state': 'POWERED_ON'}
+        ]
+        service_mock.get_resource_pools.return_value = [
+            {'resource_pool': 'rp-123', 'name': 'Test Resource Pool'}
+        ]
+        mock_service_class.return_value = service_mock
+        
+        # Create controller
+        controller = VCenterController(vcenter_config)
+        
+        # Test
+        vms = await controller.get_vms_in_cluster("Test Cluster")
+        resource_pools = await controller.get_resource_pools_in_cluster("Test Cluster")
+        
+        assert vms[0].cluster_id == "cluster-123"
+        assert resource_pools[0].cluster_id == "cluster-123"
+        service_mock.get_clusters.assert_awaited_once()
+        service_mock.get_resource_pools.assert_awaited_once_with(cluster_id="cluster-123")
+    
+    @pytest.mark.asyncio
+    @patch('main.controllers.vcenter_controller.VCenterService')
+    async def test_cluster_name_lookup_reuses_cluster_listing(self, mock_service_class, vcenter_config, service_mock):
+        """Test that listing clusters then VMs in a cluster fetches clusters once."""
+        # Setup mock
+        service_mock.get_clusters.return_value = [
+            {'cluster': 'cluster-123', 'name': 'Test Cluster'}
+        ]
+        service_mock.get_virtual_machines.return_value = [
+            {'vm': 'vm-123', 'name': 'Test VM', 'power_state': 'POWERED_ON'}
+        ]
+        mock_service_class.return_value = service_mock
+        
+        # Create controller
+        controller = VCenterController(vcenter_config)
+        
+        # Test
+        await controller.get_clusters()
+        vms = await controller.get_vms_in_cluster("Test Cluster")
+        
+        assert vms[0].cluster_id == "cluster-123"
+        service_mock.get_clusters.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    @patch('main.controllers.vcenter_controller.VCenterService')
+    async def test_get_vms_in_cluster_is_cached(self, mock_service_class, vcenter_config, service_mock):
+        """Test that repeat VM listings for a cluster are served from the list cache."""
+        # Setup mock
+        service_mock.get_clusters.return_value = [
+            {'cluster': 'cluster-123', 'name': 'Test Cluster'}
+        ]
+        service_mock.get_virtual_machines.return_value = [
+            {'vm': 'vm-123', 'name': 'Test VM', 'power_state': 'POWERED_ON'}
+        ]
+        mock_service_class.return_value = service_mock
+        
+        # Create controller
+        controller = VCenterController(vcenter_config)
+        
+        # Test
+        first = await controller.get_vms_in_cluster("Test Cluster")
+        second = await controller.get_vms_in_cluster("Test Cluster")
+        
+        assert second is first
+        assert len(second) == 1
+        service_mock.get_virtual_machines.assert_awaited_once_with(cluster_id="cluster-123")
+    
+    @pytest.mark.asyncio
+    @patch('main.controllers.vcenter_controller.VCenterService')
+    async def test_get_vcenter_status(self, mock_service_class, vcenter_config, service_mock):
+        """Test that vCenter status aggregates counts and folds in failures."""
+        # Setup mock
+        service_mock.fetch_clusters.return_value = [
+            {'cluster': 'cluster-123', 'name': 'Test Cluster'}
+        ]
+        service_mock.fetch_resource_pools.return_value = [{}, {}]
+        service_mock.fetch_virtual_machines.return_value = [{}, {}, {}]
+        mock_service_class.return_value = service_mock
+        
+        # Create controller
+        controller = VCenterController(vcenter_config)
+        
+        # Test
+        status = await controller.get_vcenter_status()
+        
+        assert status['connection_status'] == 'Connected'
+        assert status['clusters_count'] == 1
+        assert status['resource_pools_count'] == 2
+        assert status['vms_count'] == 3
+        
+        # A failing listing is reported in the status rather than raised
+        service_mock.fetch_virtual_machines.side_effect = Exception("VM listing failed")
+        status = await controller.get_vcenter_status()
+        
+        assert status['connection_status'] == 'Error'
+        assert status['error'] == "VM listing failed"
+        
+        # A failed cluster fetch means vCenter is unreachable, which takes
+        # precedence over listing errors
+        service_mock.fetch_clusters.side_effect = Exception("connection refused")
+        status = await controller.get_vcenter_status()
+        
+        assert status['connection_status'] == 'Failed'
+        
+        # The cluster fetch is the connection check, so clusters are requested once per status
+        assert service_mock.fetch_clusters.await_count == 3
+        service_mock.test_connection.assert_not_called()
 
 
 class TestMVCIntegration:
     """Test MVC integration."""
     
     @patch('main.config.config_manager.ConfigManager.get_vcenter_config')
-    def test_mvc_flow(self, mock_get_config):
+    def test_mvc_flow(self, mock_get_config, vcenter_config):
         """Test the complete MVC flow."""
         # Setup mock configuration
-        config = VCenterConfig(
-            host="https://vcenter.example.com",
-            username="admin",
-            password="password123"
-        )
-        mock_get_config.return_value = config
+        mock_get_config.return_value = vcenter_config
         
         # Test configuration manager
         config_manager = ConfigManager()
         retrieved_config = config_manager.get_vcenter_config()
-        assert retrieved_config == config
+        assert retrieved_config == vcenter_config
         
         # Test service layer
-        service = VCenterService(config)
-        assert service.config == config
+        service = VCenterService(vcenter_config)
+        assert service.config == vcenter_config
         
         # Test controller layer
-        controller = VCenterController(config)
-        assert controller.config == config
+        controller = VCenterController(vcenter_config)
+        assert controller.config == vcenter_config
         assert controller.service is not None 
\ No newline at end of file